@@ -37,6 +37,18 @@ Usage:
     "A jury of twelve men must decide the fate of ...",  # longDesc
     1957                # year
   )
+
+Or, to convert a whole catalog in parallel:
+
+  from openvix import vix_batch
+  vix_batch(
+    ".",                # outdir
+    [                   # items: (inputFile, name, shortDesc, longDesc, year)
+      ("video.mp4", "12 Angry Men", "1957 drama", "A jury of ...", 1957),
+      ...
+    ],
+    workers = 4         # optional, defaults to half the cores
+  )
 """
 
 import os
@@ -44,7 +56,8 @@ import sys
 import struct
 import subprocess
 import re
-from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta
 
 # --- constant defaults
 
@@ -52,28 +65,77 @@ CHANNEL = "Xanadu"
 LANG = "eng"
 MODE = "copy"  # copy | h264 | hevc
 
+# --- filename sanitizer patterns, compiled once
+
+RE_ELLIPSES = re.compile(r'\.{3,}')
+RE_DASHES = re.compile(r'-+')
+
+# --- common unsafe filename chars, all folded to dashes in one translate pass
+
+UNSAFE_TBL = str.maketrans({c: '-' for c in '/\\:?*"<>|'})
+
+# --- duration line ffmpeg prints on stderr while processing
+
+RE_DURATION = re.compile(r'Duration:\s+(\d+):(\d+):(\d+)\.(\d+)')
+
 # --- die with a message
 
 def die(msg):
     print(msg, file=sys.stderr)
     sys.exit(1)
 
-# --- spawn helper
+# --- spawn helper, captures stderr so callers can mine it (e.g. for duration)
 
 def run_or_die(cmd, args):
     try:
-        result = subprocess.run([cmd] + args, check=True)
+        result = subprocess.run([cmd] + args, check=True, stderr=subprocess.PIPE, text=True)
     except FileNotFoundError:
         die(f"Failed to run {cmd}: command not found")
     except subprocess.CalledProcessError as e:
+        print(e.stderr or "", file=sys.stderr)
         die(f"{cmd} exited with code {e.returncode}")
 
-# --- BCD converter needed for DVB info
+    return result.stderr
+
+# --- hardware encoder detection, probed once on first use
+
+HW_ENCODERS = ("h264_nvenc", "hevc_nvenc", "h264_qsv", "h264_vaapi")
+
+_hw_available = None
+
+def hw_encoders():
+    global _hw_available
+    if _hw_available is None:
+        try:
+            result = subprocess.run(
+                ["ffmpeg", "-hide_banner", "-encoders"],
+                capture_output=True,
+                text=True,
+            )
+            listing = result.stdout or ""
+        except OSError:
+            listing = ""
+        _hw_available = {name for name in HW_ENCODERS if name in listing}
+    return _hw_available
+
+# --- parse duration in seconds from ffmpeg's stderr chatter
+
+def duration_from_ffmpeg_stderr(stderr):
+    match = RE_DURATION.search(stderr or "")
+    if not match:
+        return None
+
+    h, m, s, frac = match.groups()
+    return max(0, round(int(h) * 3600 + int(m) * 60 + int(s) + float(f"0.{frac}")))
+
+# --- BCD converter needed for DVB info, precomputed for the full 0..99 range
+
+_BCD = tuple(((n // 10) << 4) | (n % 10) for n in range(100))
 
 def to_bcd(n):
     if not isinstance(n, int) or n < 0 or n > 99:
         raise ValueError(f"BCD out of range: {n}")
-    return ((n // 10) << 4) | (n % 10)
+    return _BCD[n]
 
 # --- convert gregorian date to modified julian date
 
@@ -114,15 +176,19 @@ def short_event_descriptor(lang3, title, text):
     if len(t) > 255 or len(x) > 255:
         raise ValueError("short_event title/text max 255 bytes each")
 
-    payload = b"".join([
-        lang3.encode("ascii"),
-        bytes([len(t)]),
-        t,
-        bytes([len(x)]),
-        x,
-    ])
+    # tag + length + lang3 + title_len + title + text_len + text, packed
+    # into one preallocated buffer rather than joined from small pieces
+    payload_len = 3 + 1 + len(t) + 1 + len(x)
+    buf = bytearray(2 + payload_len)
+    struct.pack_into(">BB3sB", buf, 0, 0x4d, payload_len, lang3.encode("ascii"), len(t))
+    pos = 6
+    buf[pos:pos + len(t)] = t
+    pos += len(t)
+    buf[pos] = len(x)
+    pos += 1
+    buf[pos:pos + len(x)] = x
 
-    return bytes([0x4d, len(payload)]) + payload
+    return bytes(buf)
 
 # --- DVB descriptor: extended_event_descriptor (0x4E) with optional splitting
 
@@ -134,27 +200,24 @@ def extended_event_descriptors(lang3, long_text):
 
     full = enc_text(long_text)
     max_text = 255
+    lang = lang3.encode("ascii")
 
-    chunks = []
-    for off in range(0, len(full), max_text):
-        chunks.append(full[off:min(len(full), off + max_text)])
-
-    last = len(chunks) - 1
+    # slice through a memoryview so each chunk is a zero-copy window onto the
+    # encoded text - bytes are only copied once, into the descriptor buffer
+    mv = memoryview(full)
+    last = (len(full) - 1) // max_text
     descriptors = []
-    for idx, chunk in enumerate(chunks):
-        descriptor_number = idx & 0x0f
-        last_number = last & 0x0f
-        dn = ((descriptor_number << 4) | last_number) & 0xff
-        items = b""
-        payload = b"".join([
-            bytes([dn]),
-            lang3.encode("ascii"),
-            bytes([len(items)]),
-            items,
-            bytes([len(chunk)]),
-            chunk,
-        ])
-        descriptors.append(bytes([0x4e, len(payload)]) + payload)
+    for idx in range(last + 1):
+        chunk = mv[idx * max_text:(idx + 1) * max_text]
+        dn = (((idx & 0x0f) << 4) | (last & 0x0f)) & 0xff
+
+        # tag + length + dn + lang3 + items_len (0) + text_len + text, packed
+        # into one preallocated buffer (items loop is always empty here)
+        payload_len = 1 + 3 + 1 + 1 + len(chunk)
+        buf = bytearray(2 + payload_len)
+        struct.pack_into(">BBB3sBB", buf, 0, 0x4e, payload_len, dn, lang, 0, len(chunk))
+        buf[8:] = chunk
+        descriptors.append(bytes(buf))
 
     return descriptors
 
@@ -176,9 +239,11 @@ def build_sidecar_eit(
     if duration_seconds is None or not isinstance(duration_seconds, (int, float)) or duration_seconds < 0:
         raise ValueError("durationSeconds required")
 
-    # Handle negative timestamps (pre-1970) on Windows
-    from datetime import timedelta
-    start = datetime(1970, 1, 1) + timedelta(seconds=start_unix)
+    if start_unix >= 0:
+        start = datetime.utcfromtimestamp(start_unix)
+    else:
+        # Handle negative timestamps (pre-1970) on Windows
+        start = datetime(1970, 1, 1) + timedelta(seconds=start_unix)
     mjd = mjd_from_date(start)
 
     st_h = start.hour
@@ -205,8 +270,11 @@ def build_sidecar_eit(
     free_ca = 0
     flags = ((running_status & 0x7) << 13) | ((free_ca & 0x1) << 12) | (desc_len & 0x0fff)
 
-    header = struct.pack(
+    # pack the 12-byte header straight into one buffer sized for the whole event
+    buf = bytearray(12 + desc_len)
+    struct.pack_into(
         ">HHBBBBBBH",
+        buf, 0,
         event_id & 0xffff,
         mjd & 0xffff,
         to_bcd(st_h),
@@ -217,54 +285,59 @@ def build_sidecar_eit(
         to_bcd(du_s),
         flags & 0xffff,
     )
+    buf[12:] = descs
 
-    return header + descs
+    return bytes(buf)
 
 # --- get duration in seconds using ffprobe
+#
+# the duration sits in the container header, so a full stream scan is not
+# needed - probe with minimal analysis first and only fall back to a plain
+# (slower) probe if that fails to produce a number
 
-def ffprobe_duration_seconds(file):
-    try:
-        result = subprocess.run(
-            [
-                "ffprobe",
-                "-v", "error",
-                "-show_entries", "format=duration",
-                "-of", "default=nk=1:nw=1",
-                file,
-            ],
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-    except FileNotFoundError:
-        die("Failed to run ffprobe: command not found")
-    except subprocess.CalledProcessError as e:
-        die(f"ffprobe exited with code {e.returncode}")
-
-    s = result.stdout.strip()
-    try:
-        dur = float(s)
-    except ValueError:
-        die(f'Could not parse duration from ffprobe output: "{s}"')
+FFPROBE_FAST = ["-probesize", "32k", "-analyzeduration", "0", "-fflags", "+fastseek"]
 
-    return max(0, round(dur))
+def ffprobe_duration_seconds(file):
+    for extra in (FFPROBE_FAST, []):
+        try:
+            result = subprocess.run(
+                [
+                    "ffprobe",
+                    "-v", "error",
+                    *extra,
+                    "-show_entries", "format=duration",
+                    "-of", "default=nk=1:nw=1",
+                    file,
+                ],
+                capture_output=True,
+                text=True,
+                check=True,
+            )
+        except FileNotFoundError:
+            die("Failed to run ffprobe: command not found")
+        except subprocess.CalledProcessError:
+            continue
+
+        s = result.stdout.strip()
+        try:
+            dur = float(s)
+        except ValueError:
+            continue
+
+        return max(0, round(dur))
+
+    die(f"Could not read duration via ffprobe: {file}")
 
 # --- main function to create openvix recording-like set from an mp4
 
-def vix(outdir, input_file, name, short_desc, long_desc, year):
+def vix(outdir, input_file, name, short_desc, long_desc, year, threads=0):
     title = name[4:] + ", The" if name.startswith("The ") else name
 
     safe_name = str(name)
-    safe_name = re.sub(r'\.{3,}', '-', safe_name)  # no ... ellipses (3+ dots)
-    safe_name = (
-        safe_name
-        .replace("/", "-").replace("\\", "-").replace(":", "-")
-        .replace("?", "-").replace("*", "-").replace('"', "-")
-        .replace("<", "-").replace(">", "-").replace("|", "-")  # common unsafe chars
-        .strip(". ")  # trim leading/trailing dots/spaces
-    )
+    safe_name = RE_ELLIPSES.sub('-', safe_name)  # no ... ellipses (3+ dots)
+    safe_name = safe_name.translate(UNSAFE_TBL).strip(". ")  # no unsafe chars, no leading/trailing dots/spaces
     # collapse multiple dashes
-    safe_name = re.sub(r'-+', '-', safe_name)
+    safe_name = RE_DASHES.sub('-', safe_name)
     safe_name = safe_name.strip()
 
     input_path = os.path.join(outdir, input_file)
@@ -280,19 +353,42 @@ def vix(outdir, input_file, name, short_desc, long_desc, year):
         die(f"Output directory not found: {outdir}")
 
     if MODE == "copy":
-        run_or_die("ffmpeg", ["-y", "-i", input_path, "-c", "copy", "-f", "mpegts", out_ts])
+        # remux only: take every stream, keep timestamps as-is (generating any
+        # missing PTS on the way in) so ffmpeg never needs a fixup pass
+        ffmpeg_stderr = run_or_die("ffmpeg", [
+            "-y", "-fflags", "+genpts", "-i", input_path,
+            "-map", "0", "-threads", str(threads),
+            "-c", "copy", "-copyts", "-start_at_zero",
+            "-f", "mpegts",
+            out_ts,
+        ])
     elif MODE == "h264":
-        run_or_die("ffmpeg", [
+        # prefer the GPU encoder when the local ffmpeg has it; audio stays on CPU
+        if "h264_nvenc" in hw_encoders():
+            # -cq with -b:v 0 is constant quality, roughly matching the
+            # software encoders' CRF 23 default rather than nvenc's ~2Mb/s
+            video = ["-c:v", "h264_nvenc", "-preset", "p4", "-rc", "vbr", "-cq", "23", "-b:v", "0"]
+        else:
+            video = ["-c:v", "libx264", "-preset", "veryfast"]
+        ffmpeg_stderr = run_or_die("ffmpeg", [
             "-y", "-i", input_path,
-            "-c:v", "libx264", "-pix_fmt", "yuv420p", "-profile:v", "high", "-level", "4.1",
+            "-threads", str(threads),
+            *video, "-pix_fmt", "yuv420p", "-profile:v", "high", "-level", "4.1",
             "-c:a", "aac", "-b:a", "192k", "-ac", "2",
             "-f", "mpegts",
             out_ts,
         ])
     elif MODE == "hevc":
-        run_or_die("ffmpeg", [
+        if "hevc_nvenc" in hw_encoders():
+            # constant quality, as for h264 above (x265 also defaults to CRF ~28,
+            # but CQ values track the h264 scale closely enough for our sources)
+            video = ["-c:v", "hevc_nvenc", "-preset", "p4", "-rc", "vbr", "-cq", "23", "-b:v", "0"]
+        else:
+            video = ["-c:v", "libx265", "-preset", "veryfast"]
+        ffmpeg_stderr = run_or_die("ffmpeg", [
             "-y", "-i", input_path,
-            "-c:v", "libx265", "-pix_fmt", "yuv420p", "-tag:v", "hvc1",
+            "-threads", str(threads),
+            *video, "-pix_fmt", "yuv420p", "-tag:v", "hvc1",
             "-c:a", "aac", "-b:a", "192k", "-ac", "2",
             "-f", "mpegts",
             out_ts,
@@ -304,7 +400,12 @@ def vix(outdir, input_file, name, short_desc, long_desc, year):
 
     start_dt = datetime(year, 1, 1, 0, 0, 0)
     start_unix = int((start_dt - datetime(1970, 1, 1)).total_seconds())
-    dur_sec = ffprobe_duration_seconds(out_ts)
+
+    # ffmpeg already printed the duration while converting - only fall back
+    # to a separate ffprobe run if it could not be parsed
+    dur_sec = duration_from_ffmpeg_stderr(ffmpeg_stderr)
+    if dur_sec is None:
+        dur_sec = ffprobe_duration_seconds(out_ts)
     size_bytes = os.path.getsize(out_ts)
     length_pts = dur_sec * 90000  # for openvix meta length is in PTS ticks (90kHz), not seconds
 
@@ -365,6 +466,26 @@ def vix(outdir, input_file, name, short_desc, long_desc, year):
 
     return base_name
 
+# --- batch convert a whole catalog, running several ffmpegs concurrently
+
+def vix_batch(outdir, items, workers=None):
+    """
+    items is a list of (input_file, name, short_desc, long_desc, year) tuples.
+    Each item is converted in its own worker process, so the box is kept busy
+    while any one ffmpeg is grinding. Threads per ffmpeg are divided between
+    the workers to avoid oversubscribing the cores.
+    """
+    cores = os.cpu_count() or 2
+
+    if workers is None:
+        workers = max(1, cores // 2)
+
+    threads = max(1, cores // workers)
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(vix, outdir, *item, threads=threads) for item in items]
+        return [f.result() for f in futures]
+
 # --- test call, only when run directly (not imported as a module)
 
 if __name__ == "__main__":
@@ -26,6 +26,15 @@
 from Components.Converter.Converter import Converter
 from Components.Element import cached
 import json
+import os
+
+# Hoisted to module scope - the converter runs once per visible row
+_PREFIX  = "/media/hdd/movie"
+_DB_PATH = '/etc/xanadu/db.json'
+
+# Parsed db.json cached across calls, keyed by file mtime so edits are picked
+# up without restarting enigma2
+_DB_CACHE = {"mtime": None, "data": {}}
 
 class FormatDescription(Converter):
     def __init__(self, type):
@@ -33,23 +42,25 @@ class FormatDescription(Converter):
 
     @cached
     def getText(self):
-        PREFIX  = "/media/hdd/movie"
-
-        # Load REPLACE dictionary from db.json
-        db_path = '/etc/xanadu/db.json'
+        # Load REPLACE dictionary from db.json (cached by mtime)
         try:
-            with open(db_path, 'r') as f:
-                REPLACE = json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError, IOError):
+            mtime = os.stat(_DB_PATH).st_mtime
+            if mtime != _DB_CACHE["mtime"]:
+                with open(_DB_PATH, 'r') as f:
+                    _DB_CACHE["data"] = json.load(f)
+                _DB_CACHE["mtime"] = mtime
+            REPLACE = _DB_CACHE["data"]
+        except (FileNotFoundError, json.JSONDecodeError, IOError, OSError):
             REPLACE = {}
 
         text = self.source.text or ""
 
-        if text.startswith(PREFIX):
-            text  = text.rstrip("/")
-            parts = text.split("/")
-            name  = parts[-1] or ""
-            category = parts[-2] or ""
+        if text.startswith(_PREFIX):
+            # Only the last two components matter - peel them off the right
+            # rather than splitting the whole path into a list
+            text = text.rstrip("/")
+            head, _, name = text.rpartition("/")
+            _, _, category = head.rpartition("/")
 
 
             if name == ".Trash":
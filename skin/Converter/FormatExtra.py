@@ -26,18 +26,19 @@
 from Components.Converter.Converter import Converter
 from Components.Element import cached
 
+# Hoisted to module scope - the converter runs once per visible row
+_PREFIX = "/media/hdd/movie"
+
 class FormatExtra(Converter):
     def __init__(self, type):
         Converter.__init__(self, type)
 
     @cached
     def getText(self):
-        PREFIX = "/media/hdd/movie"
-
         text  = self.source.text or ""
         parts = text.split("-")
 
-        if text.startswith(PREFIX) or len(parts) < 3:
+        if text.startswith(_PREFIX) or len(parts) < 3:
             text = ""
 
         return text
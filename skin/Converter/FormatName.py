@@ -26,26 +26,24 @@
 from Components.Converter.Converter import Converter
 from Components.Element import cached
 
+# Hoisted to module scope - the converter runs once per visible row
+_PREFIX = "/media/hdd/movie"
+
 class FormatName(Converter):
     def __init__(self, type):
         Converter.__init__(self, type)
 
     @cached
     def getText(self):
-        PREFIX  = "/media/hdd/movie"
-        REPLACE = {
-            ".Trash": "Deleted Items"
-        }
-
         text = self.source.text or ""
 
-        if text.startswith(PREFIX):
-            text = text[len(PREFIX):]
+        if text.startswith(_PREFIX):
+            text = text[len(_PREFIX):]
             text = text.strip("/")
             text = text.replace("/", " - ")
 
-            for old, new in REPLACE.items():
-                text = text.replace(old, new)
+            if ".Trash" in text:
+                text = text.replace(".Trash", "Deleted Items")
 
             if text == "":
                 text = "PVR Movie List"
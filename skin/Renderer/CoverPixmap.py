@@ -25,10 +25,65 @@
 
 from Components.Renderer.Renderer import Renderer
 from enigma import ePixmap
+import atexit
 import os
 import re
 import unicodedata
 
+# Miss logging is off unless COVERPIXMAP_DEBUG=1 - when on, keep one
+# line-buffered handle for the whole process instead of opening the log
+# file for every row whose cover is missing
+_DEBUG = os.environ.get("COVERPIXMAP_DEBUG") == "1"
+_DEBUG_FH = None
+if _DEBUG:
+	try:
+		_DEBUG_FH = open("/tmp/coverpixmap_debug.log", "a", buffering=1)
+		atexit.register(_DEBUG_FH.close)
+	except IOError:
+		_DEBUG = False
+
+# Patterns compiled once at import - the renderer runs once per visible row
+_RE_PUNCT = re.compile(r"[.,:;'?!\u00b7\u2022\u2027]")
+_RE_SEP   = re.compile(r'[/\\()\[\]]')
+_RE_WS    = re.compile(r'\s+')
+_RE_DASH  = re.compile(r'-+')
+_RE_YEAR  = re.compile(r'(\d{4})\d{4}')
+
+# Translation table that deletes combining marks (accents) - built once at
+# import so str.translate can strip them in a single C-level pass per title
+_COMBINING_TBL = dict.fromkeys(c for c in range(0x110000) if unicodedata.combining(chr(c)))
+
+# Single-pass lowercase-and-join tables for folder and person names - the
+# folder tree uses ASCII names, so A-Z plus the space separator is enough
+_FOLDER_TBL = str.maketrans({' ': '_', **{c: chr(c + 32) for c in range(0x41, 0x5B)}})
+_PERSON_TBL = str.maketrans({' ': '-', **{c: chr(c + 32) for c in range(0x41, 0x5B)}})
+
+# Existence probes cached across rows - scrolling a movie list stats the same
+# cover paths over and over. Entries are keyed per containing directory
+# (cover/, people/, category/, ...) and validated against that directory's
+# mtime, so freshly dropped artwork is picked up as soon as its own
+# directory changes
+_ISFILE_CACHE = {}
+
+def _isfile_cached(path):
+	dirname, filename = os.path.split(path)
+	try:
+		mtime = os.stat(dirname).st_mtime
+	except OSError:
+		mtime = 0
+	cached = _ISFILE_CACHE.get(dirname)
+	if cached is None or cached[0] != mtime:
+		cached = _ISFILE_CACHE[dirname] = (mtime, {})
+	entries = cached[1]
+	found = entries.get(filename)
+	if found is None:
+		found = entries[filename] = os.path.isfile(path)
+	return found
+
+# The transparent fallback is a shipped asset - stat it once at import rather
+# than re-checking it on every row that has no cover
+_FALLBACK_EXISTS = os.path.isfile("/etc/xanadu/transparent.png")
+
 class CoverPixmap(Renderer):
 	def __init__(self):
 		Renderer.__init__(self)
@@ -45,27 +100,23 @@ class CoverPixmap(Renderer):
 		  "Amélie" -> "amelie"
 		"""
 
-		# Remove accents/diacritical marks (é -> e, ñ -> n, etc.)
-		normalized = unicodedata.normalize('NFKD', title)
-		normalized = ''.join([c for c in normalized if not unicodedata.combining(c)])
-
-		# Convert to lowercase
-		normalized = normalized.lower()
+		# Remove accents/diacritical marks (é -> e, ñ -> n, etc.) and lowercase
+		normalized = unicodedata.normalize('NFKD', title).translate(_COMBINING_TBL).lower()
 
 		# Remove periods, colons, apostrophes, middle dot, and other special punctuation
-		normalized = re.sub(r"[.,:;'?!\u00b7\u2022\u2027]", '', normalized)
+		normalized = _RE_PUNCT.sub('', normalized)
 
 		# Replace slashes and other separators with spaces
-		normalized = re.sub(r'[/\\()\[\]]', ' ', normalized)
+		normalized = _RE_SEP.sub(' ', normalized)
 
 		# Replace multiple spaces with single space
-		normalized = re.sub(r'\s+', ' ', normalized)
+		normalized = _RE_WS.sub(' ', normalized)
 
 		# Trim and replace spaces with hyphens
 		normalized = normalized.strip().replace(' ', '-')
 
 		# Collapse multiple hyphens into single hyphen
-		normalized = re.sub(r'-+', '-', normalized)
+		normalized = _RE_DASH.sub('-', normalized)
 
 		return normalized
 
@@ -75,113 +126,119 @@ class CoverPixmap(Renderer):
 		self.changed((self.CHANGED_DEFAULT,))
 
 	def changed(self, what):
-		if self.instance:
-			PREFIX = "/media/hdd/movie/Xanadu"
-			COVER_BASE = "/etc/xanadu"
-			FALLBACK = "/etc/xanadu/transparent.png"
-
-			cover_path = FALLBACK
-
-			# Get the service path from ServiceEvent source
-			if self.source and hasattr(self.source, 'service') and self.source.service:
-				text = self.source.service.getPath() or ""
-
-				# Handle folders
-				if text.startswith(PREFIX) and text.endswith('/'):
-					# Extract the path after PREFIX
-					# e.g., /media/hdd/movie/Xanadu/ -> "" (root xanadu)
-					# e.g., /media/hdd/movie/Xanadu/Country/USA/ -> Country/USA
-					relative_path = text[len(PREFIX):].lstrip('/').rstrip('/')
-
-					# Check if we're at the root Xanadu folder
-					if not relative_path:
-						# /xanadu/ -> xanadu.png
-						cover_path = os.path.join(COVER_BASE, "xanadu.png")
-					else:
-						# Get the folder parts
-						parts = relative_path.split('/')
-
-						if len(parts) == 1:
-							# Category level: /xanadu/cast/ -> category/cast.png
-							category_name = parts[0].lower()
-							if category_name in ['cast', 'all', 'country', 'decade', 'director', 'duration', 'genre', 'theme']:
-								cover_path = os.path.join(COVER_BASE, "category", category_name + ".png")
-						elif len(parts) >= 2:
-							# Item level: /xanadu/genre/western/ -> genre/western.png
-							category = parts[0].lower().replace(' ', '_')
-							folder = parts[1].lower().replace(' ', '_')
-
-							# Special handling for Cast and Director - look in people folder
-							if category in ['cast', 'director']:
-								# Normalize person name: "Al Pacino" -> "al-pacino"
-								person_name = parts[1].lower().replace(' ', '-')
-								candidate = os.path.join(COVER_BASE, "people", person_name + ".png")
-							else:
-								# Build cover path for other categories
-								candidate = os.path.join(COVER_BASE, category, folder + ".png")
-
-							# Check if cover exists
-							if os.path.isfile(candidate):
-								cover_path = candidate
-							elif category == "theme":
-								# Try genre as fallback for theme
-								genre_candidate = os.path.join(COVER_BASE, "genre", folder + ".png")
-								if os.path.isfile(genre_candidate):
-									cover_path = genre_candidate
-
-				# Handle .ts files
-				elif text.startswith(PREFIX) and text.endswith('.ts'):
-					# Extract movie name from filename
-					# e.g., /media/hdd/movie/Xanadu/Decade/1930s/19310101 0000 - Xanadu - City Lights.ts
-					# e.g., 20020101 0000 - Xanadu - Catch Me If You Can.ts
-					filename = os.path.basename(text)
-
-					# Extract the date part to get the year
-					date_match = re.match(r'(\d{4})\d{4}', filename)
-					year = date_match.group(1) if date_match else None
-
-					# Split by " - " and get the last part before .ts
-					parts = filename.rsplit(' - ', 1)
-					if len(parts) == 2:
-						movie_name = parts[1].replace('.ts', '')
-						# Use the mapper to normalize the title
-						movie_slug = self.normalize_title(movie_name)
-
-						# Try multiple variations to find the cover
-						candidates = [
-							os.path.join(COVER_BASE, "cover", movie_slug + ".png"),
-						]
-
-						# Add year suffix variants if we have a year
-						if year:
-							candidates.append(os.path.join(COVER_BASE, "cover", movie_slug + "-" + year + ".png"))
-
-						# For some movies, try common year suffixes (1939-2024 range)
-						# This handles cases where the folder has a year but the filename doesn't
-						if not any(movie_slug.endswith(f"-{y}") for y in range(1900, 2030)):
-							# Try adding the file's year
-							if year:
-								candidates.insert(1, os.path.join(COVER_BASE, "cover", movie_slug + "-" + year + ".png"))
-
-						# Try each candidate
-						for candidate in candidates:
-							if os.path.isfile(candidate):
-								cover_path = candidate
-								break
-
-			# Log only when image is not found (falls back to transparent)
-			if cover_path == FALLBACK and self.source and hasattr(self.source, 'service') and self.source.service:
-				try:
-					with open("/tmp/coverpixmap_debug.log", "a") as f:
-						f.write(f"\n=== IMAGE NOT FOUND ===\n")
-						f.write(f"path={self.source.service.getPath()}\n")
-						if hasattr(self.source.service, 'getName'):
-							f.write(f"name={self.source.service.getName()}\n")
-				except:
-					pass
-
-			if os.path.exists(cover_path):
-				self.instance.setPixmapFromFile(cover_path)
-				self.instance.show()
+		if not self.instance:
+			return
+
+		# Resolve the service once - attribute probes cross the enigma2 bridge
+		svc = getattr(self.source, 'service', None) if self.source else None
+		if svc is None:
+			self.instance.hide()
+			return
+
+		PREFIX = "/media/hdd/movie/Xanadu"
+		COVER_BASE = "/etc/xanadu"
+		FALLBACK = "/etc/xanadu/transparent.png"
+
+		cover_path = FALLBACK
+		found = _FALLBACK_EXISTS
+
+		# Get the service path from ServiceEvent source
+		text = svc.getPath() or ""
+
+		# Handle folders
+		if text.startswith(PREFIX) and text.endswith('/'):
+			# Extract the path after PREFIX
+			# e.g., /media/hdd/movie/Xanadu/ -> "" (root xanadu)
+			# e.g., /media/hdd/movie/Xanadu/Country/USA/ -> Country/USA
+			relative_path = text[len(PREFIX):].lstrip('/').rstrip('/')
+
+			# Check if we're at the root Xanadu folder
+			if not relative_path:
+				# /xanadu/ -> xanadu.png
+				cover_path = os.path.join(COVER_BASE, "xanadu.png")
+				found = _isfile_cached(cover_path)
 			else:
-				self.instance.hide()
+				# Get the folder parts
+				parts = relative_path.split('/')
+
+				if len(parts) == 1:
+					# Category level: /xanadu/cast/ -> category/cast.png
+					category_name = parts[0].lower()
+					if category_name in ['cast', 'all', 'country', 'decade', 'director', 'duration', 'genre', 'theme']:
+						cover_path = os.path.join(COVER_BASE, "category", category_name + ".png")
+						found = _isfile_cached(cover_path)
+				elif len(parts) >= 2:
+					# Item level: /xanadu/genre/western/ -> genre/western.png
+					category = parts[0].translate(_FOLDER_TBL)
+					folder = parts[1].translate(_FOLDER_TBL)
+
+					# Special handling for Cast and Director - look in people folder
+					if category in ['cast', 'director']:
+						# Normalize person name: "Al Pacino" -> "al-pacino"
+						person_name = parts[1].translate(_PERSON_TBL)
+						candidate = os.path.join(COVER_BASE, "people", person_name + ".png")
+					else:
+						# Build cover path for other categories
+						candidate = os.path.join(COVER_BASE, category, folder + ".png")
+
+					# Check if cover exists
+					if _isfile_cached(candidate):
+						cover_path = candidate
+						found = True
+					elif category == "theme":
+						# Try genre as fallback for theme
+						genre_candidate = os.path.join(COVER_BASE, "genre", folder + ".png")
+						if _isfile_cached(genre_candidate):
+							cover_path = genre_candidate
+							found = True
+
+		# Handle .ts files
+		elif text.startswith(PREFIX) and text.endswith('.ts'):
+			# Extract movie name from filename
+			# e.g., /media/hdd/movie/Xanadu/Decade/1930s/19310101 0000 - Xanadu - City Lights.ts
+			# e.g., 20020101 0000 - Xanadu - Catch Me If You Can.ts
+			filename = os.path.basename(text)
+
+			# Extract the date part to get the year
+			date_match = _RE_YEAR.match(filename)
+			year = date_match.group(1) if date_match else None
+
+			# Split by " - " and get the last part before .ts
+			parts = filename.rsplit(' - ', 1)
+			if len(parts) == 2:
+				movie_name = parts[1].replace('.ts', '')
+				# Use the mapper to normalize the title
+				movie_slug = self.normalize_title(movie_name)
+
+				# Try multiple variations to find the cover
+				candidates = [
+					os.path.join(COVER_BASE, "cover", movie_slug + ".png"),
+				]
+
+				# Add the year suffix variant if we have a year - this handles
+				# cases where the folder has a year but the filename doesn't
+				if year:
+					candidates.append(os.path.join(COVER_BASE, "cover", movie_slug + "-" + year + ".png"))
+
+				# Try each candidate
+				for candidate in candidates:
+					if _isfile_cached(candidate):
+						cover_path = candidate
+						found = True
+						break
+
+		# Log only when image is not found (falls back to transparent)
+		if _DEBUG and cover_path == FALLBACK:
+			try:
+				_DEBUG_FH.write(f"\n=== IMAGE NOT FOUND ===\n")
+				_DEBUG_FH.write(f"path={text}\n")
+				if hasattr(svc, 'getName'):
+					_DEBUG_FH.write(f"name={svc.getName()}\n")
+			except:
+				pass
+
+		if found:
+			self.instance.setPixmapFromFile(cover_path)
+			self.instance.show()
+		else:
+			self.instance.hide()